@@ -1,5 +1,7 @@
 from typing import Dict, Optional, Iterable, Tuple, \
     Callable, Union, TYPE_CHECKING
+import copy
+import operator
 
 import numpy as np
 import numpy_financial as npf
@@ -100,6 +102,34 @@ class Cell(object):
         self._variable_words: WordConstructor = None
         self.excel_data_validation: dict = None
 
+    def _clone(self) -> 'Cell':
+        """Create a copy of the cell.
+
+        Unlike the deep copy, the cell indices are shared (passed only as a
+            reference) and only the mutable containers (words, Excel format
+            and data validation) are copied.
+
+        Returns:
+            Cell: Copy of the cell.
+        """
+        clone = copy.copy(self)
+        clone._excel_format = dict(self._excel_format)
+        if self.excel_data_validation is not None:
+            clone.excel_data_validation = dict(self.excel_data_validation)
+        if self._constructing_words is not None:
+            clone._constructing_words = WordConstructor(
+                words=dict(self._constructing_words.words),
+                languages=set(self._constructing_words.languages),
+                cell_indices=self.cell_indices
+            )
+        if self._variable_words is not None:
+            clone._variable_words = WordConstructor(
+                words=dict(self._variable_words.words),
+                languages=set(self._variable_words.languages),
+                cell_indices=self.cell_indices
+            )
+        return clone
+
     # === CLASS METHODS and PROPERTIES: ===
     @property
     def word(self) -> WordConstructor:
@@ -280,18 +310,20 @@ class Cell(object):
 
     @staticmethod
     def _compute_value(function: callable,
+                       *args,
                        **operands) -> Union[float, str, CellValueError]:
         """Function for performing computations (and asserting the
             CellValueError if needed).
 
         Args:
+            args: Positional operands for the function.
             operands: Dictionary of operands for the function.
 
         Returns:
             Union[float, str, CellValueError]: Computed value or error.
         """
         try:
-            return function(**operands)
+            return function(*args, **operands)
         except BaseException:  # noqa
             # Maximally generic here is OK
             return CellValueError()
@@ -803,6 +835,23 @@ class Cell(object):
         return Cell._aggregate_fun(cell_start, cell_end, subset,
                                    'count', len)
 
+    @staticmethod
+    def count_constant(number_of_cells: int,
+                       cell_start: 'Cell', cell_end: 'Cell') -> 'Cell':
+        """Construct the number of items of the slice when the number is
+            already known (cells are not iterated).
+
+        Args:
+            number_of_cells (int): Number of items in the slice.
+            cell_start (Cell): Starting cell of the slice (left top).
+            cell_end: (Cell'): Ending cell of the slice (bottom right).
+
+        Returns:
+            Cell: the cell with aggregated and computed results.
+        """
+        return Cell._aggregate_cell(cell_start, cell_end, 'count',
+                                    number_of_cells)
+
     @staticmethod
     def irr(cell_start: 'Cell', cell_end: 'Cell',
             subset: Iterable['Cell']) -> 'Cell':
@@ -863,14 +912,38 @@ class Cell(object):
         Raises:
             ValueError: If the starting or ending cells are not anchored.
         """
-        if not(cell_start.anchored and cell_end.anchored):
-            raise ValueError("All cells in the slice has to be anchored!")
-
         try:
             cell_value = method_np([c.value for c in subset])
         except BaseException:  # noqa
             cell_value = CellValueError()
 
+        return Cell._aggregate_cell(cell_start, cell_end, grammar_method,
+                                    cell_value)
+
+    @staticmethod
+    def _aggregate_cell(
+            cell_start: 'Cell',
+            cell_end: 'Cell',
+            grammar_method: str,
+            cell_value: object
+    ) -> 'Cell':
+        """Construct the cell with the aggregation of the slice.
+
+        Args:
+            cell_start (Cell): Starting cell of the slice (left top).
+            cell_end: (Cell'): Ending cell of the slice (bottom right).
+            grammar_method (str): What method is used (like 'minimum', ...)
+            cell_value (object): Computed value of the aggregation.
+
+        Returns:
+            Cell: the cell with aggregated and computed results.
+
+        Raises:
+            ValueError: If the starting or ending cells are not anchored.
+        """
+        if not(cell_start.anchored and cell_end.anchored):
+            raise ValueError("All cells in the slice has to be anchored!")
+
         return Cell(value=cell_value,
                     words=Cell._construct_word(
                         cell_start,
@@ -1008,8 +1081,7 @@ class Cell(object):
         Returns:
             Cell: logarithm of the value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.log(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.log, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.logarithm,
@@ -1029,8 +1101,7 @@ class Cell(object):
         Returns:
             Cell: exponential of the value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.exp(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.exp, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.exponential,
@@ -1050,8 +1121,7 @@ class Cell(object):
         Returns:
             Cell: ceiling function value of the input
         """
-        return Cell(value=Cell._compute_value(lambda x: np.ceil(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.ceil, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.ceil,
@@ -1071,8 +1141,7 @@ class Cell(object):
         Returns:
             Cell: floor function value of the input
         """
-        return Cell(value=Cell._compute_value(lambda x: np.floor(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.floor, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.floor,
@@ -1092,8 +1161,7 @@ class Cell(object):
         Returns:
             Cell: round of the input numeric value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.round(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.round, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.round,
@@ -1113,8 +1181,7 @@ class Cell(object):
         Returns:
             Cell: absolute value of the input numeric value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.abs(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(abs, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.abs,
@@ -1134,8 +1201,7 @@ class Cell(object):
         Returns:
             Cell: square root of the input numeric value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.sqrt(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.sqrt, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.sqrt,
@@ -1155,8 +1221,7 @@ class Cell(object):
         Returns:
             Cell: signum of the input numeric value
         """
-        return Cell(value=Cell._compute_value(lambda x: np.sign(x.value),
-                                              x=other),
+        return Cell(value=Cell._compute_value(np.sign, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.signum,
@@ -1176,8 +1241,7 @@ class Cell(object):
         Returns:
             Cell: logical negation the input value
         """
-        return Cell(value=Cell._compute_value(lambda x: not x.value,
-                                              x=other),
+        return Cell(value=Cell._compute_value(operator.not_, other.value),
                     words=Cell._construct_word(
                         other,
                         WordConstructor.logicalNegation,
@@ -1,8 +1,10 @@
 from typing import List, Tuple, Dict, Optional, Callable
 import copy
+import functools
 
-from .grammars import GRAMMARS
-from .cell_indices_templates import cell_indices_generators
+from .grammar_utils import _compiled_grammar
+from .cell_indices_templates import cell_indices_generators, _int_labels
+from .skipped_label import SkippedLabel
 
 # ==== TYPES ====
 # mapping from language to list, used for mapping from language to list rows
@@ -12,9 +14,78 @@ T_lg_col_row = Dict[str, Tuple[List[str], List[str]]]
 # ===============
 
 
+def _last_cell_offset(language: str) -> int:
+    """Return the offset caused by including the last cell of the slice.
+
+    Args:
+        language (str): What language is used.
+
+    Returns:
+        int: 1 if the language includes the last cell, 0 otherwise.
+    """
+    return _compiled_grammar(language).last_cell_offset
+
+
+@functools.lru_cache(maxsize=64)
+def _default_labels(size: int) -> Tuple[str, ...]:
+    """Return the auto generated labels (integer sequence from 0).
+
+    Args:
+        size (int): Number of labels.
+
+    Returns:
+        Tuple[str, ...]: Labels '0', '1', ..., str(size - 1).
+    """
+    return tuple(_int_labels(0, size))
+
+
+def _copy_labels(labels: list) -> list:
+    """Copy the list of the labels of rows or columns.
+
+    Strings are shared by the copy, skipped labels are copied as they are
+        changed in place when exported (see SkippedLabel.replace).
+
+    Args:
+        labels (list): Labels of rows or columns.
+
+    Returns:
+        list: Copy of the labels.
+    """
+    return [copy.copy(label) if isinstance(label, SkippedLabel) else label
+            for label in labels]
+
+
+def _check_length(values: Optional[list],
+                  expected: int,
+                  name: str,
+                  dimension: str) -> None:
+    """Check if the (optional) list has the expected length.
+
+    Args:
+        values (Optional[list]): Checked list (skipped if None).
+        expected (int): Expected length of the list.
+        name (str): Name of the list used in the error message.
+        dimension (str): Name of the dimension ('rows' or 'columns').
+
+    Raises:
+        ValueError: If the length of the list does not match.
+    """
+    if values is not None and len(values) != expected:
+        raise ValueError(f"Number of {name} has to be the same "
+                         f"as number of {dimension}!")
+
+
 class CellIndices(object):
     """Represent the indices of the cells and its labels for each language.
     """
+    __slots__ = ('number_of_rows', 'number_of_columns',
+                 'excel_append_row_labels', 'excel_append_column_labels',
+                 'rows_labels', 'columns_labels',
+                 'rows_labels_str', 'columns_labels_str',
+                 'rows_help_text', 'columns_help_text',
+                 'values_only', 'rows', 'columns', 'user_defined_languages',
+                 '_languages')
+
     def __init__(self,
                  number_of_rows: int,
                  number_of_columns: int,
@@ -63,16 +134,14 @@ class CellIndices(object):
                 and len(set(columns_labels)) != len(columns_labels):
             warning_logger("There are some duplications in column labels.")
 
+        # Validate (and collect) the not-system and user defined languages
+        user_rows: T_lg_ar = {}
+        user_columns: T_lg_ar = {}
         if rows_columns is not None:
-            for language in rows_columns.keys():
+            for language, (rows, columns) in rows_columns.items():
                 # Does the language include the last cell?
                 #   if yes, offset of size 1 has to be included.
-                offset = 0
-                if GRAMMARS[
-                    language
-                ]['cells']['aggregation']['include_last_cell']:
-                    offset = 1
-                rows, columns = rows_columns[language]
+                offset = _last_cell_offset(language)
                 if len(rows) != number_of_rows + offset:
                     e_mess = "Number of rows is not the same for every " \
                              "language! Or you have not included offset " \
@@ -83,49 +152,48 @@ class CellIndices(object):
                              "language! Or you have not included offset " \
                              "caused by excluding the last value of the slice!"
                     raise ValueError(e_mess)
+                user_rows[language] = rows
+                user_columns[language] = columns
         if number_of_rows < 1 or number_of_columns < 1:
             raise ValueError("Number of rows and columns has to at least 1!")
         # check the columns and rows aliases sizes
-        if (rows_labels is not None
-                and len(rows_labels) != number_of_rows):
-            raise ValueError("Number of rows aliases has to be the same "
-                             "as number of rows!")
-        if (columns_labels is not None
-                and len(columns_labels) != number_of_columns):
-            raise ValueError("Number of columns aliases has to be the same "
-                             "as number of columns!")
+        _check_length(rows_labels, number_of_rows, 'rows aliases', 'rows')
+        _check_length(columns_labels, number_of_columns,
+                      'columns aliases', 'columns')
         # check the help texts sizes
-        if (rows_help_text is not None
-                and len(rows_help_text) != number_of_rows):
-            raise ValueError("Number of rows help texts has to be the same "
-                             "as number of rows!")
-        if (columns_help_text is not None
-                and len(columns_help_text) != number_of_columns):
-            raise ValueError("Number of columns help texts has to be the same "
-                             "as number of columns!")
+        _check_length(rows_help_text, number_of_rows,
+                      'rows help texts', 'rows')
+        _check_length(columns_help_text, number_of_columns,
+                      'columns help texts', 'columns')
         # -------------------
         self.number_of_rows: int = number_of_rows
         self.number_of_columns: int = number_of_columns
         self.excel_append_row_labels: bool = excel_append_row_labels
         self.excel_append_column_labels: bool = excel_append_column_labels
         # Define user defined names for rows and columns
-        self.rows_labels: list = copy.deepcopy(rows_labels)
-        self.columns_labels: list = copy.deepcopy(columns_labels)
-        # Or define auto generated aliases as an integer sequence from 0
-        if rows_labels is None:
-            self.rows_labels = [str(_row_n) for _row_n in
-                                range(number_of_rows)]
-        if columns_labels is None:
-            self.columns_labels = [str(_col_n) for _col_n in
-                                   range(number_of_columns)]
+        #   or define auto generated aliases as an integer sequence from 0
+        if rows_labels is not None:
+            self.rows_labels: list = _copy_labels(rows_labels)
+        else:
+            self.rows_labels: list = list(_default_labels(number_of_rows))
+        if columns_labels is not None:
+            self.columns_labels: list = _copy_labels(columns_labels)
+        else:
+            self.columns_labels: list = list(
+                _default_labels(number_of_columns)
+            )
         # String representation of indices
         self.rows_labels_str: List[str] = \
             [str(lb) for lb in self.rows_labels]
         self.columns_labels_str: List[str] = \
             [str(lb) for lb in self.columns_labels]
         # assign the help texts
-        self.rows_help_text: List[str] = copy.deepcopy(rows_help_text)
-        self.columns_help_text: List[str] = copy.deepcopy(columns_help_text)
+        self.rows_help_text: List[str] = None
+        if rows_help_text is not None:
+            self.rows_help_text = list(rows_help_text)
+        self.columns_help_text: List[str] = None
+        if columns_help_text is not None:
+            self.columns_help_text = list(columns_help_text)
         # This set the sheet to store only values and not to constructs words
         #   it is used by Cell class
         self.values_only: bool = values_only
@@ -133,6 +201,8 @@ class CellIndices(object):
         self.rows: T_lg_ar = {}
         self.columns: T_lg_ar = {}
         self.user_defined_languages: List[str] = []
+        # Names of all languages (cached as the set of languages is fixed)
+        self._languages: Tuple[str, ...] = tuple()
 
         if values_only:
             # Optimisation
@@ -157,12 +227,10 @@ class CellIndices(object):
             self.columns[language] = cols
 
         # Append the not-system languages and user defined languages
-        if rows_columns is not None:
-            for language, values in rows_columns.items():
-                rows, cols = values
-                self.rows[language] = rows
-                self.columns[language] = cols
-                self.user_defined_languages.append(language)
+        self.rows.update(user_rows)
+        self.columns.update(user_columns)
+        self.user_defined_languages.extend(user_rows.keys())
+        self._languages = tuple(str(lan) for lan in self.rows.keys())
 
     @property
     def shape(self) -> Tuple[int, int]:
@@ -180,7 +248,7 @@ class CellIndices(object):
         Returns:
             List[str]: List of all supported languages.
         """
-        return [str(lan) for lan in self.rows.keys()]
+        return list(self._languages)
 
     def expand_size(self,
                     new_number_of_rows: int,
@@ -216,32 +284,46 @@ class CellIndices(object):
             system_languages (Tuple[str, ...]): System languages that are
                 always included.
         """
-        expanded = copy.deepcopy(self)
         # Quick sanity check:
         if new_number_of_rows < 1 and new_number_of_columns < 1:
             return
         # check the columns and rows aliases sizes
-        if (new_rows_labels is not None
-                and len(new_rows_labels) != new_number_of_rows):
-            raise ValueError("Number of rows aliases has to be the same "
-                             "as number of rows!")
-        if (new_columns_labels is not None
-                and len(new_columns_labels) != new_number_of_columns):
-            raise ValueError("Number of columns aliases has to be the same "
-                             "as number of columns!")
+        _check_length(new_rows_labels, new_number_of_rows,
+                      'rows aliases', 'rows')
+        _check_length(new_columns_labels, new_number_of_columns,
+                      'columns aliases', 'columns')
         # check the help texts sizes
-        if (new_rows_help_text is not None
-                and len(new_rows_help_text) != new_number_of_rows):
-            raise ValueError("Number of rows help texts has to be the same "
-                             "as number of rows!")
-        if (new_columns_help_text is not None
-                and len(new_columns_help_text) != new_number_of_columns):
-            raise ValueError("Number of columns help texts has to be the same "
-                             "as number of columns!")
+        _check_length(new_rows_help_text, new_number_of_rows,
+                      'rows help texts', 'rows')
+        _check_length(new_columns_help_text, new_number_of_columns,
+                      'columns help texts', 'columns')
         # -------------------
         if values_only:
             system_languages = tuple()
 
+        # The lists are copied, the strings in them are shared (skipped
+        #   labels are mutable, so _copy_labels copies them)
+        expanded = object.__new__(CellIndices)
+        expanded.number_of_rows = self.number_of_rows
+        expanded.number_of_columns = self.number_of_columns
+        expanded.excel_append_row_labels = self.excel_append_row_labels
+        expanded.excel_append_column_labels = self.excel_append_column_labels
+        expanded.rows_labels = _copy_labels(self.rows_labels)
+        expanded.columns_labels = _copy_labels(self.columns_labels)
+        expanded.rows_help_text = None
+        if self.rows_help_text is not None:
+            expanded.rows_help_text = list(self.rows_help_text)
+        expanded.columns_help_text = None
+        if self.columns_help_text is not None:
+            expanded.columns_help_text = list(self.columns_help_text)
+        expanded.values_only = self.values_only
+        expanded.user_defined_languages = list(self.user_defined_languages)
+        expanded.rows = {}
+        expanded.columns = {}
+        for language in self.rows.keys():
+            expanded.rows[language] = list(self.rows[language])
+            expanded.columns[language] = list(self.columns[language])
+
         # Append the system languages
         for language, generator in cell_indices_generators.items():
             if language not in system_languages:
@@ -252,21 +334,35 @@ class CellIndices(object):
                 offset_column = 1
             if expanded.excel_append_column_labels and language == "excel":
                 offset_row = 1
-            rows, cols = generator(expanded.number_of_rows +
-                                   new_number_of_rows + offset_row,
-                                   expanded.number_of_columns +
-                                   new_number_of_columns + offset_column)
-            expanded.rows[language] = rows[offset_row:]
-            expanded.columns[language] = cols[offset_column:]
+            if language not in expanded.rows:
+                # Generate all the indices (if they were not generated yet)
+                rows, cols = generator(
+                    expanded.number_of_rows + new_number_of_rows,
+                    expanded.number_of_columns + new_number_of_columns,
+                    offset_row,
+                    offset_column
+                )
+                expanded.rows[language] = rows
+                expanded.columns[language] = cols
+                continue
+            # Generate only the indices that are added
+            rows, cols = generator(
+                new_number_of_rows,
+                new_number_of_columns,
+                expanded.number_of_rows + offset_row,
+                expanded.number_of_columns + offset_column
+            )
+            # The last cell is generated again
+            if _last_cell_offset(language) == 1:
+                del expanded.rows[language][-1]
+                del expanded.columns[language][-1]
+            expanded.rows[language].extend(rows)
+            expanded.columns[language].extend(cols)
         # Append rows to user defined languages
         for language, values in new_rows_columns.items():
             # Does the language include the last cell?
             #   if yes, offset of size 1 has to be included.
-            offset = 0
-            if GRAMMARS[
-                language
-            ]['cells']['aggregation']['include_last_cell']:
-                offset = 1
+            offset = _last_cell_offset(language)
             rows, cols = values
             # Quick sanity check
             if language not in expanded.user_defined_languages:
@@ -289,22 +385,21 @@ class CellIndices(object):
             expanded.columns[language].extend(cols)
 
         # Define user defined names for rows and columns
+        #   or append the auto generated aliases of the added rows/columns
         if new_rows_labels is not None:
             expanded.rows_labels.extend(new_rows_labels)
         else:
-            expanded.rows_labels = [
-                str(i)
-                for i in range(expanded.number_of_rows + new_number_of_rows)
-            ]
+            expanded.rows_labels.extend(_int_labels(
+                expanded.number_of_rows,
+                expanded.number_of_rows + new_number_of_rows
+            ))
         if new_columns_labels is not None:
             expanded.columns_labels.extend(new_columns_labels)
         else:
-            expanded.columns_labels = [
-                str(i)
-                for i in range(
-                    expanded.number_of_columns + new_number_of_columns
-                )
-            ]
+            expanded.columns_labels.extend(_int_labels(
+                expanded.number_of_columns,
+                expanded.number_of_columns + new_number_of_columns
+            ))
         # String representation of indices
         expanded.rows_labels_str: List[str] = \
             [str(lb) for lb in expanded.rows_labels]
@@ -321,6 +416,8 @@ class CellIndices(object):
                 raise ValueError("Columns help texts has to set.")
             expanded.columns_help_text.extend(new_columns_help_text)
 
+        expanded._languages = tuple(str(lan) for lan in expanded.rows.keys())
+
         # Modify the number of rows/columns
         expanded.number_of_rows += new_number_of_rows
         expanded.number_of_columns += new_number_of_columns
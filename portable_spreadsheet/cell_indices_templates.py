@@ -1,4 +1,10 @@
 from typing import List, Tuple
+import functools
+
+import numpy as np
+
+# Letters used in the Excel column names
+_LETTERS: str = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
 
 def general_interface(rows: int,
@@ -20,6 +26,20 @@ def general_interface(rows: int,
     pass
 
 
+def _int_labels(start: int, stop: int) -> List[str]:
+    """Generate the string representation of each integer in [start, stop).
+
+    Args:
+        start (int): The first integer.
+        stop (int): The integer after the last one.
+
+    Returns:
+        List[str]: Integers converted to strings.
+    """
+    return list(map(str, range(start, stop)))
+
+
+@functools.lru_cache(maxsize=None)
 def excel_column(column: int) -> str:
     """Convert column position (indexed from 0) to Excel column name.
 
@@ -29,43 +49,96 @@ def excel_column(column: int) -> str:
     Returns:
         str: Definition of column in Excel.
     """
-    letter_list = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
     result = []
     column += 1
     while column:
         column, rem = divmod(column - 1, 26)
-        result[:0] = letter_list[rem]
-    return ''.join(result)
+        result.append(_LETTERS[rem])
+    return ''.join(reversed(result))
 
 
 def excel_generator(rows: int,
                     columns: int,
                     offset_row: int = 0,
                     offset_column: int = 0) -> Tuple[List[str], List[str]]:
-    rows = list([str(row)
-                 for row in range(1 + offset_row, rows + 1 + offset_row)])
-    letter_list = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    cols = []
-    for column in range(offset_column, columns + offset_column):
-        col = column + 1
-        result = []
-        while col:
-            col, rem = divmod(col - 1, 26)
-            result[:0] = letter_list[rem]
-        cols.append(''.join(result))
+    rows = _int_labels(1 + offset_row, rows + 1 + offset_row)
+    cols = excel_columns(offset_column, columns + offset_column)
     return rows, cols
 
 
+def _excel_columns_generate(start: int, stop: int) -> List[str]:
+    """Convert all the column positions in the range [start, stop) to Excel
+        column names at once.
+
+    Names of the same length are converted together using NumPy: a name with
+        'width' letters is just the 'width'-digits base-26 representation of
+        the position relative to the first name of that length (A, AA, AAA).
+
+    Args:
+        start (int): First column index (position from 0).
+        stop (int): Column index (position from 0) after the last one.
+
+    Returns:
+        List[str]: Definition of columns in Excel.
+    """
+    cols: List[str] = []
+    # Positions in Excel are indexed from 1
+    position = start + 1
+    # Names of the 'width' letters are on positions [width_start, width_end)
+    width = 1
+    width_start = 1
+    width_end = 1 + 26
+    while position <= stop:
+        if position < width_end:
+            chunk_end = min(stop + 1, width_end)
+            values = np.arange(position - width_start,
+                               chunk_end - width_start)
+            codes = np.empty((values.size, width), dtype=np.uint8)
+            for digit in range(width - 1, -1, -1):
+                values, codes[:, digit] = np.divmod(values, 26)
+            codes += ord('A')
+            cols.extend(
+                codes.view(f'S{width}').ravel().astype('U').tolist()
+            )
+            position = chunk_end
+        width += 1
+        width_start = width_end
+        width_end += 26 ** width
+    return cols
+
+
+# Precomputed names of the columns A, ..., ZZ
+_EXCEL_COLUMNS_TO_ZZ: Tuple[str, ...] = tuple(
+    _excel_columns_generate(0, 26 + 26 ** 2)
+)
+
+
+def excel_columns(start: int, stop: int) -> List[str]:
+    """Convert all the column positions in the range [start, stop) to Excel
+        column names at once.
+
+    Args:
+        start (int): First column index (position from 0).
+        stop (int): Column index (position from 0) after the last one.
+
+    Returns:
+        List[str]: Definition of columns in Excel.
+    """
+    if stop <= len(_EXCEL_COLUMNS_TO_ZZ):
+        # Most of the sheets have at most 702 columns (A, ..., ZZ)
+        return list(_EXCEL_COLUMNS_TO_ZZ[start:stop])
+    return _excel_columns_generate(start, stop)
+
+
 def python_numpy_generator(rows: int,
                            columns: int,
                            offset_row: int = 0,
                            offset_column: int = 0
                            ) -> Tuple[List[str], List[str]]:
     # the + 1 value is because of offset for slices
-    rows = list([str(row) for row in range(offset_row, rows + offset_row + 1)])
+    rows = _int_labels(offset_row, rows + offset_row + 1)
     # the + 1 value is because of offset for slices
-    cols = list([str(col) for col in range(offset_column,
-                                           columns + offset_column + 1)])
+    cols = _int_labels(offset_column, columns + offset_column + 1)
     return rows, cols
 
 
@@ -73,11 +146,8 @@ def native_generator(rows: int,
                      columns: int,
                      offset_row: int = 0,
                      offset_column: int = 0) -> Tuple[List[str], List[str]]:
-    rows = list([str(row) for row in range(
-        1 + offset_row, rows + offset_row + 1)]
-                )
-    cols = list([str(col) for col in range(
-        1 + offset_column, columns + offset_column + 1)])
+    rows = _int_labels(1 + offset_row, rows + offset_row + 1)
+    cols = _int_labels(1 + offset_column, columns + offset_column + 1)
     return rows, cols
 
 
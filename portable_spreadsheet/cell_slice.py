@@ -1,6 +1,6 @@
 from numbers import Number
 from typing import Iterable, Tuple, Union, List, Optional
-import copy
+import itertools
 
 import numpy as np
 
@@ -24,9 +24,13 @@ class CellSlice(Serialization):
             inside the spreadsheet. Bottom right cell of the slice.
         start_cell (Cell): Top left cell of the slice.
         end_cell (Cell): Bottom right cell of the slice.
-        cell_subset (Iterable[Cell]): The list of all cells in the slice.
+        cell_subset (Tuple[Cell, ...]): All the cells in the slice.
         driving_sheet (Sheet): Reference to the spreadsheet.
     """
+    __slots__ = ('start_idx', 'end_idx', '_shape', 'cell_subset',
+                 '_non_empty_subset', 'driving_sheet',
+                 'start_cell', 'end_cell')
+
     def __init__(self,
                  start_idx: Tuple[int, int],
                  end_idx: Tuple[int, int],
@@ -48,12 +52,51 @@ class CellSlice(Serialization):
                          warning_logger=driving_sheet.warning_logger,
                          export_subset=True)
 
+        # Check that the slice is inside the sheet
+        rows, columns = driving_sheet.shape
+        for row, column in (start_idx, end_idx):
+            if not (-rows <= row < rows and -columns <= column < columns):
+                raise IndexError("The slice is out of the range of the "
+                                 "sheet!")
+
         self.start_idx: Tuple[int, int] = start_idx
         self.end_idx: Tuple[int, int] = end_idx
-        self.start_cell: Cell = driving_sheet.iloc[start_idx]
-        self.end_cell: Cell = driving_sheet.iloc[end_idx]
-        self.cell_subset: Iterable[Cell] = cell_subset
+        self._shape: Tuple[int, int] = (end_idx[0] - start_idx[0] + 1,
+                                        end_idx[1] - start_idx[1] + 1)
+        # Materialised once (the aggregations iterate it repeatedly)
+        self.cell_subset: Tuple[Cell, ...] = tuple(cell_subset)
+        # Cells with some value (computed on the first aggregation)
+        self._non_empty_subset: Optional[Tuple[Cell, ...]] = None
         self.driving_sheet = driving_sheet
+        # The corner cells come from the same snapshot as the cell subset;
+        #   the subset is row-major, so if it covers the whole shape (no
+        #   step), they are its first and last cell.
+        if len(self.cell_subset) == self._shape[0] * self._shape[1] > 0:
+            self.start_cell: Cell = self.cell_subset[0]
+            self.end_cell: Cell = self.cell_subset[-1]
+        else:
+            self.start_cell: Cell = driving_sheet.iloc[start_idx]
+            self.end_cell: Cell = driving_sheet.iloc[end_idx]
+
+    def _get_cell_subset(self, skip_none_cell: bool) -> Tuple[Cell, ...]:
+        """Return the cells that enter the aggregation.
+
+        Args:
+            skip_none_cell (bool): If true, skips all the cells with None as
+                a value.
+
+        Returns:
+            Tuple[Cell, ...]: Cells of the slice (the filtered subset is
+                shared by all the aggregations of the slice).
+        """
+        if not skip_none_cell:
+            return self.cell_subset
+        if self._non_empty_subset is None:
+            self._non_empty_subset = tuple(
+                nn_cell for nn_cell in self.cell_subset
+                if nn_cell.value is not None
+            )
+        return self._non_empty_subset
 
     def sum(self, skip_none_cell: bool = True) -> Cell:
         """Compute the sum of the aggregate.
@@ -65,11 +108,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.sum(self.start_cell, self.end_cell, cell_subset)
 
     def product(self, skip_none_cell: bool = True) -> Cell:
@@ -82,11 +121,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.product(self.start_cell, self.end_cell, cell_subset)
 
     def min(self, skip_none_cell: bool = True) -> Cell:
@@ -99,11 +134,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.min(self.start_cell, self.end_cell, cell_subset)
 
     def max(self, skip_none_cell: bool = True) -> Cell:
@@ -116,11 +147,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.max(self.start_cell, self.end_cell, cell_subset)
 
     def mean(self, skip_none_cell: bool = True) -> Cell:
@@ -133,11 +160,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.mean(self.start_cell, self.end_cell, cell_subset)
 
     def average(self, skip_none_cell: bool = True) -> Cell:
@@ -162,11 +185,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.stdev(self.start_cell, self.end_cell, cell_subset)
 
     def median(self, skip_none_cell: bool = True) -> Cell:
@@ -179,11 +198,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.median(self.start_cell, self.end_cell, cell_subset)
 
     def count(self, skip_none_cell: bool = True) -> Cell:
@@ -196,12 +211,10 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
-        return Cell.count(self.start_cell, self.end_cell, cell_subset)
+        # The subset is a tuple, its length is known without iterating it
+        cell_subset = self._get_cell_subset(skip_none_cell)
+        return Cell.count_constant(len(cell_subset),
+                                   self.start_cell, self.end_cell)
 
     def irr(self, skip_none_cell: bool = True) -> Cell:
         """Compute the Internal Rate of Return (IRR) of items in the aggregate.
@@ -213,11 +226,7 @@ class CellSlice(Serialization):
         Returns:
             Cell: a new cell with the result.
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.irr(self.start_cell, self.end_cell, cell_subset)
 
     def match_negative_before_positive(self,
@@ -233,14 +242,26 @@ class CellSlice(Serialization):
             Cell: Return the position of the negative number in a series that
                 is located just before the first positive number (or zero).
         """
-        if skip_none_cell:
-            cell_subset = [nn_cell for nn_cell in self.cell_subset
-                           if nn_cell.value is not None]
-        else:
-            cell_subset = self.cell_subset
+        cell_subset = self._get_cell_subset(skip_none_cell)
         return Cell.match_negative_before_positive(self.start_cell,
                                                    self.end_cell, cell_subset)
 
+    def _sheet_cells(self) -> Iterable[Cell]:
+        """Iterate over the cells currently in the sheet inside the slice.
+
+        The cell subset might be outdated if the slice has been set, so the
+        rows of the sheet are read directly.
+
+        Returns:
+            Iterable[Cell]: Cells of the slice (row by row).
+        """
+        start_col, end_col = self.start_idx[1], self.end_idx[1] + 1
+        return itertools.chain.from_iterable(
+            sheet_row[start_col:end_col]
+            for sheet_row in self.driving_sheet._sheet[self.start_idx[0]:
+                                                       self.end_idx[0] + 1]
+        )
+
     @property
     def excel_format(self):
         """Should not be accessible for slides."""
@@ -257,10 +278,9 @@ class CellSlice(Serialization):
         """
         if not isinstance(new_format, dict):
             raise ValueError("New format has to be a dictionary!")
-        for row in range(self.start_idx[0], self.end_idx[0] + 1):
-            for col in range(self.start_idx[1],
-                             self.end_idx[1] + 1):
-                self.driving_sheet.iloc[row, col].excel_format = new_format
+        # The format is already checked (shared by all the cells)
+        for cell in self._sheet_cells():
+            cell._excel_format = new_format
 
     @property
     def description(self) -> Optional[str]:
@@ -278,39 +298,8 @@ class CellSlice(Serialization):
         if (new_description is not None
                 and not isinstance(new_description, str)):
             raise ValueError("Cell description has to be a string value!")
-        for row in range(self.start_idx[0], self.end_idx[0] + 1):
-            for col in range(self.start_idx[1],
-                             self.end_idx[1] + 1):
-                self.driving_sheet.iloc[row, col].description = new_description
-
-    def _set_value_on_position(self, other: Union[Cell, Number],
-                               row: int, col: int) -> None:
-        """Set the cell on given position in the spreadsheet to the value
-            'other'.
-        Args:
-            other (Union[Cell, Number]): new value to be set.
-            row (int): the row integer position in the spreadsheet (indexed
-                from 0).
-            col (int): the column integer position in the spreadsheet (indexed
-                from 0).
-        """
-        if isinstance(other, Cell):
-            if other.anchored:
-                _value = Cell.reference(other)
-            elif other.is_variable:
-                # Set value
-                _value = Cell.variable(other)
-                # Anchor it:
-                _value.coordinates = (row, col)
-            else:
-                # Create a deep copy
-                _value = copy.deepcopy(other)
-                # Anchor it:
-                _value.coordinates = (row, col)
-            self.driving_sheet.iloc[row, col] = _value
-        else:
-            # Call the external logic to manage the same
-            self.driving_sheet.iloc[row, col] = other
+        for cell in self._sheet_cells():
+            cell._description = new_description
 
     # Set to scalar / Other cells:
     def set(self, other: T_slice) -> None:
@@ -322,55 +311,124 @@ class CellSlice(Serialization):
                 Some value or list (or numpy array) of values that should be
                 set for all the cells inside slice.
         """
-        if isinstance(other, (np.ndarray, list, tuple)):
+        start_row, start_col = self.start_idx
+        end_row, end_col = self.end_idx
+        # Setting using iloc creates variables or anchored copies of the
+        #   cells (anchored cells are replaced by the references first)
+        iloc = self.driving_sheet.iloc
+        if end_row < start_row or end_col < start_col:
+            # Empty slice
+            return
+        is_array = isinstance(other, (np.ndarray, list, tuple))
+        if not is_array and start_row == end_row and start_col == end_col:
+            # Single cell
+            iloc[start_row, start_col] = self._assigned_value(other)
+            return
+        if is_array:
+            shape = self._shape
             dim_match = True
-            is_list = True
             is_1d = False
-            by_row = self.shape[0] > self.shape[1]
-            if hasattr(other, "shape"):
-                dim_match = other.shape == self.shape
-                is_list = False
-                is_1d = len(other.shape) == 1
+            if isinstance(other, np.ndarray):
+                is_1d = other.ndim == 1
                 if is_1d:
-                    dim_match = max(other.shape) == max(self.shape)
+                    dim_match = other.shape[0] == max(shape)
+                else:
+                    dim_match = other.shape == shape
+            elif min(shape) == 1:
+                dim_match = len(other) == max(shape)
+                is_1d = True
             else:
-                is_list = True
-                if min(self.shape) == 1:
-                    dim_match = len(other) == max(self.shape)
-                    is_1d = True
+                # 2D lists are converted to the array (that also checks if
+                #   all the rows have the same length)
+                try:
+                    other = np.array(other, dtype=object)
+                except ValueError:
+                    dim_match = False
+                else:
+                    dim_match = other.shape == shape
             if not dim_match:
                 raise ValueError("Shape of the input does not match to the "
                                  "shape of the slice!")
-            if is_1d:
-                col = self.start_idx[1]
-                row = self.start_idx[0]
-                for val in other:
-                    self._set_value_on_position(val, row, col)
-                    if by_row:
-                        row += 1
-                    else:
-                        col += 1
+            if (isinstance(other, np.ndarray) and other.dtype.kind in 'biuf'
+                    and other.size == shape[0] * shape[1]):
+                # Arrays of plain numbers are wrapped to the new cells
+                #   directly
+                self._set_value_rows(other.reshape(shape))
+            elif (is_1d and min(shape) == 1
+                    and not any(isinstance(val, Cell) for val in other)):
+                # Row or column of plain values (column is passed as rows
+                #   with a single value)
+                self._set_value_rows(zip(other) if shape[0] > 1 else (other,))
+            elif is_1d:
+                # Values are set along the longer side of the slice
+                if shape[0] > shape[1]:
+                    positions = zip(range(start_row, end_row + 1),
+                                    itertools.repeat(start_col))
+                else:
+                    positions = zip(itertools.repeat(start_row),
+                                    range(start_col, end_col + 1))
+                for position, val in zip(positions, other):
+                    iloc[position] = self._assigned_value(val)
+            elif not any(isinstance(val, Cell) for val in other.flat):
+                # 2D array of plain values (the check is done once for the
+                #   whole array instead of per cell in iloc)
+                self._set_value_rows(other)
             else:
-                # If is N-dimensional
-                for row in range(self.start_idx[0], self.end_idx[0] + 1):
-                    for col in range(self.start_idx[1],
-                                     self.end_idx[1] + 1):
-                        if is_list:
-                            val = other[row - self.start_idx[0]][
-                                col - self.start_idx[1]
-                            ]
-                        else:
-                            val = other[
-                                row - self.start_idx[0],
-                                col - self.start_idx[1]
-                            ]
-                        self._set_value_on_position(val, row, col)
-
+                # If is N-dimensional (iterate over rows of the array)
+                for row, row_values in zip(range(start_row, end_row + 1),
+                                           other):
+                    for col, val in zip(range(start_col, end_col + 1),
+                                        row_values):
+                        iloc[row, col] = self._assigned_value(val)
+
+        elif isinstance(other, Cell):
+            # The reference is constructed once and anchored by iloc on
+            #   each position
+            other = self._assigned_value(other)
+            for position in itertools.product(range(start_row, end_row + 1),
+                                              range(start_col, end_col + 1)):
+                # Set the right values
+                iloc[position] = other
         else:
-            for row in range(self.start_idx[0], self.end_idx[0] + 1):
-                for col in range(self.start_idx[1], self.end_idx[1] + 1):
-                    # Set the right values
-                    self._set_value_on_position(other, row, col)
+            # Scalar values are wrapped to the new cells directly
+            self._set_value_rows(
+                itertools.repeat([other] * self._shape[1], self._shape[0])
+            )
+
+    @staticmethod
+    def _assigned_value(value: object) -> object:
+        """Return the value that is set to the position in the slice.
+
+        Args:
+            value (object): Value (or cell) assigned to the slice.
+
+        Returns:
+            object: Reference to the cell if the cell is anchored, the value
+                itself otherwise.
+        """
+        if isinstance(value, Cell) and value.anchored:
+            return Cell.reference(value)
+        return value
+
+    def _set_value_rows(self, values: Iterable[Iterable[object]]) -> None:
+        """Replace the cells of the slice by the new cells with given values.
+
+        Args:
+            values (Iterable[Iterable[object]]): Values of the new cells (row
+                by row), has to match the shape of the slice.
+        """
+        start_row, start_col = self.start_idx
+        end_col = self.end_idx[1]
+        sheet = self.driving_sheet._sheet
+        cell_indices = self.driving_sheet.cell_indices
+        columns = range(start_col, end_col + 1)
+        for row, row_values in zip(range(start_row, self.end_idx[0] + 1),
+                                   values):
+            # The whole row segment is replaced at once
+            sheet[row][start_col:end_col + 1] = [
+                Cell(row, col, value=value, cell_indices=cell_indices)
+                for col, value in zip(columns, row_values)
+            ]
 
     def __ilshift__(self, other: T_slice):
         """Overrides operator <<= to do a set functionality.
@@ -385,8 +443,7 @@ class CellSlice(Serialization):
         Returns:
             Tuple[int]: Number of rows, Number of columns
         """
-        return (self.end_idx[0] - self.start_idx[0] + 1,
-                self.end_idx[1] - self.start_idx[1] + 1)
+        return self._shape
 
     @Serialization.cell_indices.getter
     def cell_indices(self) -> CellIndices:
@@ -1,52 +1,227 @@
-from typing import Set
+from typing import Dict, NamedTuple, Set, Tuple
+import sys
 
 from .grammars import GRAMMAR_PATTERN, GRAMMARS
 
 
-class GrammarUtils(object):
-    """Utils for validating and adding user defined grammars to the system.
+# ==== TYPES ====
+# Prefix, suffix and the clauses in the order of the grammar, each clause is
+#   the tuple (position of the clause word in the canonical order, prefix,
+#   suffix)
+T_clauses = Tuple[str, str, Tuple[Tuple[int, str, str], ...]]
+# ===============
+
+# Canonical order of the words of the clauses
+_CONDITIONAL_CLAUSES = ('condition', 'consequent', 'alternative')
+_OFFSET_CLAUSES = ('reference-cell-row', 'reference-cell-column',
+                   'skip-of-rows', 'skip-of-columns')
+
+
+class _CompiledGrammar(NamedTuple):
+    """Flat view of the parts of the grammar used for constructing words.
+
+    Attributes:
+        operations (Dict[str, Tuple[str, str, str]]): Mapping from the name
+            of the operation to its prefix, separator (empty string for
+            unary operations) and suffix.
+        brackets (Tuple[str, str]): Prefix and suffix of the brackets.
+        operation (Tuple[str, str]): Prefix and suffix of the computational
+            cell word.
+        constant_numeric (Tuple[str, str]): Prefix and suffix of numbers.
+        constant_string (Tuple[str, str]): Prefix and suffix of strings.
+        concatenate_numeric (Tuple[str, str]): Prefix and suffix of numbers
+            in the concatenation.
+        concatenate_string (Tuple[str, str]): Prefix and suffix of strings in
+            the concatenation.
+        empty (str): Content of the empty cell.
+        reference (Tuple[str, str, str, bool]): Prefix, separator, suffix
+            and if the row is the first in the reference.
+        aggregation (Tuple[str, str, str]): Prefix, separator and suffix of
+            the aggregation.
+        aggregation_start (Tuple[str, str, str, bool, bool, bool]): Prefix,
+            separator, suffix, row first, rows only and columns only flags
+            of the starting cell of the aggregation.
+        aggregation_end (Tuple[str, str, str, bool, bool, bool]): The same
+            for the ending cell of the aggregation.
+        last_cell_offset (int): 1 if the language includes the last cell of
+            the slice, 0 otherwise.
+        cross_reference (Tuple[str, str, str, bool, str, str, bool]): Cell
+            prefix, separator, suffix, if the row is the first, sheet prefix,
+            suffix and if the sheet is the first in the cross-reference.
+        variable (Tuple[str, str, bool, str, str]): Prefix, suffix, if the
+            value is included and the prefix and suffix of the value.
+        linear_interpolation (str): Pattern of the linear interpolation.
+        conditional (T_clauses): Prefix, suffix and clauses of the
+            conditional (in the order of the grammar).
+        offset (T_clauses): Prefix, suffix and clauses of the offset (in the
+            order of the grammar).
     """
+    operations: Dict[str, Tuple[str, str, str]]
+    brackets: Tuple[str, str]
+    operation: Tuple[str, str]
+    constant_numeric: Tuple[str, str]
+    constant_string: Tuple[str, str]
+    concatenate_numeric: Tuple[str, str]
+    concatenate_string: Tuple[str, str]
+    empty: str
+    reference: Tuple[str, str, str, bool]
+    aggregation: Tuple[str, str, str]
+    aggregation_start: Tuple[str, str, str, bool, bool, bool]
+    aggregation_end: Tuple[str, str, str, bool, bool, bool]
+    last_cell_offset: int
+    cross_reference: Tuple[str, str, str, bool, str, str, bool]
+    variable: Tuple[str, str, bool, str, str]
+    linear_interpolation: str
+    conditional: 'T_clauses'
+    offset: 'T_clauses'
 
-    @staticmethod
-    def _get_value_at_path(grammar: dict, path: list):
-        """Get the value on the path in the dictionary of logic defined in the
-            path ['a', 'b'].
 
-        Args:
-            grammar (dict): Grammar dictionary.
-            path (list): Path inside the grammar (1D array)
+# Cache of the compiled grammars (mapping from language to tuple (grammar,
+#   compiled grammar)).
+_COMPILED_GRAMMARS: Dict[str, Tuple[dict, _CompiledGrammar]] = {}
 
-        Returns:
-            object: value inside
-        """
-        if len(path) == 0:
-            return grammar
-        else:
-            start, *rest = path
-            return GrammarUtils._get_value_at_path(grammar[start], rest)
+
+def _affixes(definition: dict,
+             keys: Tuple[str, ...] = ('prefix', 'suffix')) -> Tuple[str, ...]:
+    """Return the interned strings of the grammar definition.
+
+    The strings are concatenated to every constructed word, interning makes
+        all the words share the same (few) string objects.
+
+    Args:
+        definition (dict): Part of the grammar.
+        keys (Tuple[str, ...]): Keys of the strings.
+
+    Returns:
+        Tuple[str, ...]: Interned strings in the order of keys.
+    """
+    return tuple(sys.intern(definition[key]) for key in keys)
+
+
+def _clauses(definition: dict, canonical_order: Tuple[str, ...]
+             ) -> T_clauses:
+    """Resolve the order of the clauses of the statement.
+
+    Args:
+        definition (dict): Definition of the statement in the grammar.
+        canonical_order (Tuple[str, ...]): Order in which the words of the
+            clauses are passed when the word is constructed.
+
+    Returns:
+        T_clauses: Prefix, suffix and clauses in the order of the grammar.
+    """
+    return _affixes(definition) + (tuple(
+        (canonical_order.index(clause),) + _affixes(definition[clause])
+        for clause in definition['order']
+    ),)
+
+
+def _compile_grammar(grammar: dict) -> _CompiledGrammar:
+    """Flatten the grammar to the structure used for constructing words.
+
+    Args:
+        grammar (dict): Grammar definition.
+
+    Returns:
+        _CompiledGrammar: Flattened grammar.
+    """
+    cells = grammar['cells']
+    concatenate = grammar['operations']['concatenate']
+    aggregation = cells['aggregation']
+    reference = cells['reference']
+    cross_reference = cells['cross-reference']
+    variable = cells['variable']
+    separated = ('prefix', 'separator', 'suffix')
+
+    def _aggregation_cell(definition: dict
+                          ) -> Tuple[str, str, str, bool, bool, bool]:
+        return _affixes(definition, separated) + (
+            bool(definition['row_first']), bool(definition['rows_only']),
+            bool(definition['cols_only'])
+        )
+
+    return _CompiledGrammar(
+        operations={
+            # Unary operations do not have any separator
+            name: _affixes({'separator': '', **operation}, separated)
+            for name, operation in grammar['operations'].items()
+        },
+        brackets=_affixes(grammar['brackets']),
+        operation=_affixes(cells['operation']),
+        constant_numeric=_affixes(cells['constant-numeric']),
+        constant_string=_affixes(cells['constant-string']),
+        concatenate_numeric=_affixes(concatenate['numeric-value']),
+        concatenate_string=_affixes(concatenate['string-value']),
+        empty=sys.intern(cells['empty']['content']),
+        reference=_affixes(reference, separated) + (
+            bool(reference['row_first']),
+        ),
+        aggregation=_affixes(aggregation, separated),
+        aggregation_start=_aggregation_cell(aggregation['start_cell']),
+        aggregation_end=_aggregation_cell(aggregation['end_cell']),
+        last_cell_offset=int(bool(aggregation['include_last_cell'])),
+        cross_reference=_affixes(
+            cross_reference, ('cell-prefix', 'cell-separator', 'cell-suffix')
+        ) + (bool(cross_reference['row-first']),) + _affixes(
+            cross_reference, ('sheet-prefix', 'sheet-suffix')
+        ) + (bool(cross_reference['sheet-first']),),
+        variable=_affixes(variable) + (
+            bool(variable['value']['include']),
+        ) + _affixes(variable['value']),
+        linear_interpolation=grammar['linear-interpolation']['word'],
+        conditional=_clauses(grammar['conditional'], _CONDITIONAL_CLAUSES),
+        offset=_clauses(cells['offset'], _OFFSET_CLAUSES)
+    )
+
+
+def _compiled_grammar(language: str) -> _CompiledGrammar:
+    """Return the compiled grammar of the language.
+
+    The compiled grammar is cached per language; the cache entry is valid as
+        long as the language is defined by the same grammar object (grammars
+        can be added and removed at runtime). Registered grammars must not be
+        mutated in place, re-register the language to change its grammar.
+
+    Args:
+        language (str): What language is used.
+
+    Returns:
+        _CompiledGrammar: Flattened grammar of the language.
+    """
+    grammar = GRAMMARS[language]
+    cached = _COMPILED_GRAMMARS.get(language)
+    if cached is None or cached[0] is not grammar:
+        cached = (grammar, _compile_grammar(grammar))
+        _COMPILED_GRAMMARS[language] = cached
+    return cached[1]
+
+
+class GrammarUtils(object):
+    """Utils for validating and adding user defined grammars to the system.
+    """
 
     @staticmethod
-    def _check_dictionary(grammar: dict, key: list = []):
+    def _check_dictionary(grammar: dict,
+                          pattern: dict = GRAMMAR_PATTERN,
+                          key: list = []):
         """Walk across all values in the grammar and check if types of all
             words definitions matches.
 
         Args:
-            grammar (dict): Probed grammar.
+            grammar (dict): Probed (sub-)grammar.
+            pattern (dict): The part of the grammar pattern on the same path
+                as the probed grammar.
             key (list): The path to the probed entity.
         """
-        # Possibly dictionary, possibly value:
-        _pos_dict = GrammarUtils._get_value_at_path(grammar, key)
-        if isinstance(_pos_dict, dict):
-            _keys = _pos_dict.keys()
-            for _key in _keys:
-                GrammarUtils._check_dictionary(grammar, key + [_key])
-        else:
+        for _key, _value in grammar.items():
+            # Possibly dictionary, possibly value:
+            if isinstance(_value, dict):
+                GrammarUtils._check_dictionary(_value, pattern[_key],
+                                               key + [_key])
             # Expected type
-            ex_type = GrammarUtils._get_value_at_path(GRAMMAR_PATTERN, key)
-            if isinstance(_pos_dict, ex_type):
-                pass
-            else:
-                raise ValueError(f"Input grammar is not valid at path {key}!")
+            elif not isinstance(_value, pattern[_key]):
+                raise ValueError("Input grammar is not valid at path "
+                                 f"{key + [_key]}!")
 
     @staticmethod
     def validate_grammar(grammar: dict, raise_exception: bool = False) -> bool:
@@ -80,6 +255,9 @@ class GrammarUtils(object):
     def add_grammar(grammar_definition: dict, language_name: str) -> None:
         """Add the grammar to the system.
 
+        The grammar must not be mutated after it is added, remove and add the
+            language again to change it.
+
         Args:
             grammar_definition (dict): Definition of the grammar.
             language_name (str): Name of the language (like 'excel', 'python')
@@ -89,6 +267,8 @@ class GrammarUtils(object):
         # Add the grammar
         if language_name not in GRAMMARS.keys():
             GRAMMARS[language_name] = grammar_definition
+            # Drop the grammar compiled for the previous definition
+            _COMPILED_GRAMMARS.pop(language_name, None)
         else:
             raise ValueError(f"Language {language_name} is already in the "
                              "system.")
@@ -103,6 +283,7 @@ class GrammarUtils(object):
         # Add the grammar
         if language_name in GRAMMARS.keys():
             del GRAMMARS[language_name]
+            _COMPILED_GRAMMARS.pop(language_name, None)
         else:
             raise ValueError(f"Language {language_name} is not in the "
                              "system.")
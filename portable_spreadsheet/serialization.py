@@ -2,7 +2,6 @@ import abc
 import json
 from typing import Tuple, List, Dict, Union, Callable, Optional
 from types import MappingProxyType
-from numbers import Number
 import pathlib
 
 import xlsxwriter
@@ -13,7 +12,7 @@ from .cell_type import CellType
 from .cell_indices import CellIndices
 from .skipped_label import SkippedLabel
 from .serialization_interface import SerializationInterface
-from .utils import NumPyEncoder
+from .utils import NumPyEncoder, is_number
 from .cell_indices_templates import excel_column
 
 # ==== TYPES ====
@@ -84,6 +83,7 @@ class Serialization(SerializationInterface, abc.ABC):
         export_subset (bool): If true, warning are raised when exporting.
         name (Optional[str]): Name of this object (typically sheet).
     """
+    __slots__ = ('export_offset', 'warning_logger', 'export_subset', 'name')
 
     def __init__(self, *,
                  export_offset: Tuple[int, int] = (0, 0),
@@ -354,7 +354,7 @@ class Serialization(SerializationInterface, abc.ABC):
                 if cell.value is not None:
                     cell_value = cell.value
                     # Replace the NaN value
-                    if isinstance(cell_value, Number):
+                    if is_number(cell_value):
                         if numpy.isnan(cell_value):
                             cell_value = nan_replacement
                         elif not numpy.isfinite(cell_value):
@@ -1225,7 +1225,7 @@ class Serialization(SerializationInterface, abc.ABC):
                 if (
                     value := self._get_cell_at(row_idx, col_idx).value  # noqa
                 ) is not None:
-                    if isinstance(value, Number):
+                    if is_number(value):
                         results[row_idx, col_idx] = value
                     else:
                         results[row_idx, col_idx] = numpy.nan
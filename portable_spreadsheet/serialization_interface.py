@@ -2,6 +2,8 @@ import abc
 
 
 class SerializationInterface(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_excel(self, *args, **kwargs):
         raise NotImplementedError
@@ -186,8 +186,8 @@ class Sheet(Serialization):
                     # Anchor it:
                     _value.coordinates = (_x, _y)
                 else:
-                    # Create a deep copy
-                    _value = copy.deepcopy(value)
+                    # Create a copy
+                    _value = value._clone()
                     # Anchor it:
                     _value.coordinates = (_x, _y)
             else:
@@ -1,7 +1,23 @@
 import abc
+from numbers import Number
 import numpy
 import json
 
+# Concrete numeric types that are checked before the (slow) abstract Number
+_NUMERIC_TYPES = frozenset((int, float, numpy.float64, numpy.int64))
+
+
+def is_number(value) -> bool:
+    """Check if the value is a number (instance of numbers.Number).
+
+    Args:
+        value: Checked value.
+
+    Returns:
+        bool: True if the value is a number, False otherwise.
+    """
+    return type(value) in _NUMERIC_TYPES or isinstance(value, Number)
+
 
 class ClassVarsToDict(abc.ABC):
     """Allows to export class variables to dictionary using dict(inst)
@@ -1,11 +1,11 @@
 import copy
-from numbers import Number
-from typing import Dict, Set, Tuple, TYPE_CHECKING
+from typing import Dict, Optional, Set, Tuple, TYPE_CHECKING
 
-from .grammars import GRAMMARS
+from .grammar_utils import _compiled_grammar
 
 from .cell_indices import CellIndices
 from .cell_type import CellType
+from .utils import is_number
 
 if TYPE_CHECKING:
     from .cell import Cell
@@ -83,9 +83,7 @@ class WordConstructor(object):
         first_words = first.word.words
         second_word = second.word.words
         for language in instance.languages:
-            pref = GRAMMARS[language]['operations'][operation]['prefix']
-            suff = GRAMMARS[language]['operations'][operation]['suffix']
-            sp = GRAMMARS[language]['operations'][operation]['separator']
+            pref, sp, suff = _compiled_grammar(language).operations[operation]
             instance.words[language] = pref + first_words[language] + sp \
                 + second_word[language] + suff
         return instance
@@ -339,17 +337,12 @@ class WordConstructor(object):
                 elif in_cell.cell_type == CellType.value_only:
                     words: T_word = {}
                     for language in in_cell.word.languages:
+                        grammar = _compiled_grammar(language)
                         if isinstance(in_cell.value, str):
-                            pref = GRAMMARS[language]['operations'][
-                                'concatenate']['string-value']['prefix']
-                            suff = GRAMMARS[language]['operations'][
-                                'concatenate']['string-value']['suffix']
+                            pref, suff = grammar.concatenate_string
                             words[language] = pref + str(in_cell.value) + suff
-                        if isinstance(in_cell.value, Number):
-                            pref = GRAMMARS[language]['operations'][
-                                'concatenate']['numeric-value']['prefix']
-                            suff = GRAMMARS[language]['operations'][
-                                'concatenate']['numeric-value']['suffix']
+                        if is_number(in_cell.value):
+                            pref, suff = grammar.concatenate_numeric
                             words[language] = pref + str(in_cell.value) + suff
                     return words
 
@@ -357,9 +350,9 @@ class WordConstructor(object):
         first_words = _generate_word_string_concatenate(first)
         second_word = _generate_word_string_concatenate(second)
         for language in instance.languages:
-            pref = GRAMMARS[language]['operations']['concatenate']['prefix']
-            suff = GRAMMARS[language]['operations']['concatenate']['suffix']
-            sp = GRAMMARS[language]['operations']['concatenate']['separator']
+            pref, sp, suff = _compiled_grammar(language).operations[
+                'concatenate'
+            ]
             instance.words[language] = pref + first_words[language] + sp \
                 + second_word[language] + suff
         return instance
@@ -382,80 +375,55 @@ class WordConstructor(object):
         Returns:
             Tuple[str, str]: Definition of starting, ending cell in language.
         """
+        grammar = _compiled_grammar(language)
         # Does the language include the last cell?
         #   if yes, offset of size 1 has to be included.
-        offset = 0
-        if GRAMMARS[
-            language
-        ]['cells']['aggregation']['include_last_cell']:
-            offset = 1
+        offset = grammar.last_cell_offset
 
         start_idx_r = cell.cell_indices.rows[language][start_idx[0]]
         start_idx_c = cell.cell_indices.columns[language][start_idx[1]]
         end_idx_r = cell.cell_indices.rows[language][end_idx[0] + offset]
         end_idx_c = cell.cell_indices.columns[language][end_idx[1] + offset]
 
-        pref_cell_start = GRAMMARS[language]['cells']['aggregation'][
-            'start_cell']['prefix']
-        separator_cell_start = GRAMMARS[language]['cells']['aggregation'][
-            'start_cell']['separator']
-        suffix_cell_start = GRAMMARS[language]['cells']['aggregation'][
-            'start_cell']['suffix']
+        (pref_cell_start, separator_cell_start, suffix_cell_start,
+         row_first, rows_only, cols_only) = grammar.aggregation_start
 
-        if GRAMMARS[language]['cells']['aggregation']['start_cell'][
-            'row_first'
-        ]:
+        if rows_only:
             cell_start = (pref_cell_start + start_idx_r +
-                          separator_cell_start + start_idx_c +
+                          separator_cell_start + end_idx_r +
                           suffix_cell_start)
-        else:
+        elif cols_only:
             cell_start = (pref_cell_start + start_idx_c +
-                          separator_cell_start + start_idx_r +
+                          separator_cell_start + end_idx_c +
                           suffix_cell_start)
-
-        if GRAMMARS[language]['cells']['aggregation']['start_cell'][
-            'rows_only'
-        ]:
+        elif row_first:
             cell_start = (pref_cell_start + start_idx_r +
-                          separator_cell_start + end_idx_r +
+                          separator_cell_start + start_idx_c +
                           suffix_cell_start)
-        elif GRAMMARS[language]['cells']['aggregation']['start_cell'][
-            'cols_only'
-        ]:
+        else:
             cell_start = (pref_cell_start + start_idx_c +
-                          separator_cell_start + end_idx_c +
+                          separator_cell_start + start_idx_r +
                           suffix_cell_start)
         # ---------- ending cell -----
-        pref_cell_end = GRAMMARS[language]['cells']['aggregation'][
-            'end_cell']['prefix']
-        separator_cell_end = GRAMMARS[language]['cells']['aggregation'][
-            'end_cell']['separator']
-        suffix_cell_end = GRAMMARS[language]['cells']['aggregation'][
-            'end_cell']['suffix']
-
-        if GRAMMARS[language]['cells']['aggregation']['end_cell'][
-            'row_first'
-        ]:
-            cell_end = (pref_cell_end + end_idx_r +
-                        separator_cell_end + end_idx_c +
-                        suffix_cell_end)
-        else:
-            cell_end = (pref_cell_end + end_idx_c +
-                        separator_cell_end + end_idx_r +
-                        suffix_cell_end)
+        (pref_cell_end, separator_cell_end, suffix_cell_end,
+         row_first, rows_only, cols_only) = grammar.aggregation_end
 
-        if GRAMMARS[language]['cells']['aggregation']['end_cell'][
-            'rows_only'
-        ]:
+        if rows_only:
             cell_end = (pref_cell_end + start_idx_r +
                         separator_cell_end + end_idx_r +
                         suffix_cell_end)
-        elif GRAMMARS[language]['cells']['aggregation']['end_cell'][
-            'cols_only'
-        ]:
+        elif cols_only:
             cell_end = (pref_cell_end + start_idx_c +
                         separator_cell_end + end_idx_c +
                         suffix_cell_end)
+        elif row_first:
+            cell_end = (pref_cell_end + end_idx_r +
+                        separator_cell_end + end_idx_c +
+                        suffix_cell_end)
+        else:
+            cell_end = (pref_cell_end + end_idx_c +
+                        separator_cell_end + end_idx_r +
+                        suffix_cell_end)
         # ----------------------------
         return cell_start, cell_end
 
@@ -482,20 +450,14 @@ class WordConstructor(object):
 
         instance = WordConstructor(cell_indices=cell_start.cell_indices)
         for language in instance.languages:
-            prefix = GRAMMARS[language]['cells']['aggregation']['prefix']
-            separator = GRAMMARS[language]['cells']['aggregation']['separator']
-            suffix = GRAMMARS[language]['cells']['aggregation']['suffix']
+            grammar = _compiled_grammar(language)
+            prefix, separator, suffix = grammar.aggregation
 
             start, end = WordConstructor._aggregation_parse_cell(
                 cell_start, start_idx, end_idx, language
             )
             # Methods
-            m_prefix = GRAMMARS[language]['operations'][grammar_method][
-                'prefix'
-            ]
-            m_suffix = GRAMMARS[language]['operations'][grammar_method][
-                'suffix'
-            ]
+            m_prefix, _, m_suffix = grammar.operations[grammar_method]
 
             instance.words[language] = (m_prefix + prefix + start +
                                         separator + end + suffix + m_suffix)
@@ -526,8 +488,7 @@ class WordConstructor(object):
             if variable_word and cell._variable_words is not None:
                 words = copy.deepcopy(cell._variable_words.words)
             for language in cell.constructing_words.languages:
-                prefix = GRAMMARS[language]['cells']['operation']['prefix']
-                suffix = GRAMMARS[language]['cells']['operation']['suffix']
+                prefix, suffix = _compiled_grammar(language).operation
                 words[language] = prefix + words[language] + suffix
             return words
 
@@ -559,8 +520,7 @@ class WordConstructor(object):
         """
         instance = WordConstructor(cell_indices=cell.cell_indices)
         for language in instance.languages:
-            content = GRAMMARS[language]['cells']['empty']['content']
-            instance.words[language] = content
+            instance.words[language] = _compiled_grammar(language).empty
         return instance
 
     @staticmethod
@@ -575,16 +535,16 @@ class WordConstructor(object):
         """
         instance = WordConstructor(cell_indices=cell.cell_indices)
         for language in instance.languages:
-            prefix = GRAMMARS[language]['cells']['reference']['prefix']
-            separator = GRAMMARS[language]['cells']['reference']['separator']
-            suffix = GRAMMARS[language]['cells']['reference']['suffix']
-            row_first = GRAMMARS[language]['cells']['reference']['row_first']
+            prefix, separator, suffix, row_first = _compiled_grammar(
+                language
+            ).reference
             # Parse the position to the text of the column and row
             col_parsed = cell.cell_indices.columns[language][cell.column]
             row_parsed = cell.cell_indices.rows[language][cell.row]
-            body = prefix + col_parsed + separator + row_parsed + suffix
             if row_first:
                 body = prefix + row_parsed + separator + col_parsed + suffix
+            else:
+                body = prefix + col_parsed + separator + row_parsed + suffix
             instance.words[language] = body
         return instance
 
@@ -601,19 +561,11 @@ class WordConstructor(object):
         """
         instance = WordConstructor(cell_indices=cell.cell_indices)
         for language in instance.languages:
+            (cell_prefix, cell_separator, cell_suffix, row_first,
+             sheet_prefix, sheet_suffix, sheet_first) = _compiled_grammar(
+                language
+            ).cross_reference
             # Deal with cell reference
-            cell_prefix = GRAMMARS[language]['cells']['cross-reference'][
-                'cell-prefix'
-            ]
-            cell_separator = GRAMMARS[language]['cells']['cross-reference'][
-                'cell-separator'
-            ]
-            cell_suffix = GRAMMARS[language]['cells']['cross-reference'][
-                'cell-suffix'
-            ]
-            row_first = GRAMMARS[language]['cells']['cross-reference'][
-                'row-first'
-            ]
             # Parse the position to the text of the column and row
             col_parsed = cell.cell_indices.columns[language][cell.column]
             row_parsed = cell.cell_indices.rows[language][cell.row]
@@ -626,15 +578,6 @@ class WordConstructor(object):
                              cell_separator + row_parsed + cell_suffix)
 
             # Deal with sheet reference
-            sheet_prefix = GRAMMARS[language]['cells']['cross-reference'][
-                'sheet-prefix'
-            ]
-            sheet_suffix = GRAMMARS[language]['cells']['cross-reference'][
-                'sheet-suffix'
-            ]
-            sheet_first = GRAMMARS[language]['cells']['cross-reference'][
-                'sheet-first'
-            ]
             ref_sheet_value = sheet_prefix + sheet.name + sheet_suffix
             if sheet_first:
                 body = ref_sheet_value + cell_body
@@ -658,13 +601,9 @@ class WordConstructor(object):
         instance = WordConstructor(cell_indices=cell.cell_indices)
         for language in instance.languages:
             if isinstance(cell.value, str):
-                pref = GRAMMARS[language]['cells']['constant-string']['prefix']
-                suff = GRAMMARS[language]['cells']['constant-string']['suffix']
-            if isinstance(cell.value, Number):
-                pref = GRAMMARS[language]['cells'][
-                    'constant-numeric']['prefix']
-                suff = GRAMMARS[language]['cells'][
-                    'constant-numeric']['suffix']
+                pref, suff = _compiled_grammar(language).constant_string
+            if is_number(cell.value):
+                pref, suff = _compiled_grammar(language).constant_numeric
             instance.words[language] = pref + str(cell.value) + suff
         return instance
 
@@ -680,15 +619,14 @@ class WordConstructor(object):
         """
         instance = WordConstructor(cell_indices=cell.cell_indices)
         for language in instance.languages:
-            prefix = GRAMMARS[language]['cells']['variable']['prefix']
-            suffix = GRAMMARS[language]['cells']['variable']['suffix']
+            (prefix, suffix, include_value,
+             value_prefix, value_suffix) = _compiled_grammar(
+                language
+            ).variable
             # Now add the value as a suffix if required
             value_word = ""
-            value_grammar = GRAMMARS[language]['cells']['variable']['value']
-            if value_grammar['include']:
-                value_word += value_grammar['prefix']
-                value_word += str(cell.value)
-                value_word += value_grammar['suffix']
+            if include_value:
+                value_word = value_prefix + str(cell.value) + value_suffix
             # Construct the whole word
             instance.words[language] = (prefix + cell.variable_name
                                         + value_word + suffix)
@@ -698,26 +636,24 @@ class WordConstructor(object):
     @staticmethod
     def _unary_operator(*,
                         cell: 'Cell',
-                        prefix_path: Tuple[str],
-                        suffix_path: Tuple[str]) -> 'WordConstructor':
+                        operation: Optional[str]) -> 'WordConstructor':
         """Word creation logic for a general unary operator.
 
         Args:
             cell (Cell): The cell that is the body of the unary operator.
-            prefix_path (Tuple[str]): The path to prefix of the unary operator.
-            suffix_path (Tuple[str]): The path to suffix of the unary operator.
+            operation (Optional[str]): The name of the unary operator in the
+                grammar (or None for the brackets).
 
         Returns:
             'WordConstructor': Word constructed by the operator.
         """
         instance = copy.deepcopy(cell.word)
         for language in instance.languages:
-            prefix = GRAMMARS[language]
-            for path_item in prefix_path:
-                prefix = prefix[path_item]
-            suffix = GRAMMARS[language]
-            for path_item in suffix_path:
-                suffix = suffix[path_item]
+            grammar = _compiled_grammar(language)
+            if operation is None:
+                prefix, suffix = grammar.brackets
+            else:
+                prefix, _, suffix = grammar.operations[operation]
             body = instance.words[language]
             instance.words[language] = prefix + body + suffix
         return instance
@@ -734,8 +670,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['brackets', 'prefix'],
-            suffix_path=['brackets', 'suffix']
+            operation=None
         )
 
     @staticmethod
@@ -750,8 +685,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'logarithm', 'prefix'],
-            suffix_path=['operations', 'logarithm', 'suffix']
+            operation='logarithm'
         )
 
     @staticmethod
@@ -766,8 +700,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'exponential', 'prefix'],
-            suffix_path=['operations', 'exponential', 'suffix']
+            operation='exponential'
         )
 
     @staticmethod
@@ -782,8 +715,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'ceil', 'prefix'],
-            suffix_path=['operations', 'ceil', 'suffix']
+            operation='ceil'
         )
 
     @staticmethod
@@ -798,8 +730,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'floor', 'prefix'],
-            suffix_path=['operations', 'floor', 'suffix']
+            operation='floor'
         )
 
     @staticmethod
@@ -814,8 +745,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'round', 'prefix'],
-            suffix_path=['operations', 'round', 'suffix']
+            operation='round'
         )
 
     @staticmethod
@@ -830,8 +760,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'abs', 'prefix'],
-            suffix_path=['operations', 'abs', 'suffix']
+            operation='abs'
         )
 
     @staticmethod
@@ -846,8 +775,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'sqrt', 'prefix'],
-            suffix_path=['operations', 'sqrt', 'suffix']
+            operation='sqrt'
         )
 
     @staticmethod
@@ -862,8 +790,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'signum', 'prefix'],
-            suffix_path=['operations', 'signum', 'suffix']
+            operation='signum'
         )
 
     @staticmethod
@@ -879,8 +806,7 @@ class WordConstructor(object):
         """
         return WordConstructor._unary_operator(
             cell=cell,
-            prefix_path=['operations', 'logical-negation', 'prefix'],
-            suffix_path=['operations', 'logical-negation', 'suffix']
+            operation='logical-negation'
         )
 
     @staticmethod
@@ -904,47 +830,14 @@ class WordConstructor(object):
         w_alternative = alternative.word.words
 
         for language in instance.languages:
-            conditional_prefix = GRAMMARS[language]['conditional']['prefix']
-            conditional_suffix = GRAMMARS[language]['conditional']['suffix']
-
-            condition_prefix = GRAMMARS[language][
-                'conditional']['condition']['prefix']
-            condition_suffix = GRAMMARS[language][
-                'conditional']['condition']['suffix']
-            condition_word = condition_prefix + w_condition[language] + \
-                condition_suffix
-
-            consequent_prefix = GRAMMARS[language][
-                'conditional']['consequent']['prefix']
-            consequent_suffix = GRAMMARS[language][
-                'conditional']['consequent']['suffix']
-            consequent_word = consequent_prefix + w_consequent[language] + \
-                consequent_suffix
-
-            alternative_prefix = GRAMMARS[language][
-                'conditional']['alternative']['prefix']
-            alternative_suffix = GRAMMARS[language][
-                'conditional']['alternative']['suffix']
-            alternative_word = alternative_prefix + w_alternative[language] + \
-                alternative_suffix
-
-            # Swap the words to desired sequence
-            clausules_order = GRAMMARS[language]['conditional']['order']
-            prefered_order = ('condition', 'consequent', 'alternative')
-            words_in_prefered_order = (condition_word, consequent_word,
-                                       alternative_word)
-            words_in_correct_order = ["", "", ""]
-            # Do the permutation and construct the word:
-            for clausule_idx, clausule in enumerate(prefered_order):
-                clausule_permutated_idx = clausules_order.index(clausule)
-                words_in_correct_order[clausule_permutated_idx] = \
-                    words_in_prefered_order[clausule_idx]
-
-            # Merge words into one word
-            final_word = "".join(words_in_correct_order)
-
-            instance.words[language] = conditional_prefix + final_word + \
-                conditional_suffix
+            prefix, suffix, clauses = _compiled_grammar(language).conditional
+            words = (w_condition[language], w_consequent[language],
+                     w_alternative[language])
+            # Merge words of the clauses (in the order of the grammar)
+            instance.words[language] = prefix + "".join([
+                clause_prefix + words[word_idx] + clause_suffix
+                for word_idx, clause_prefix, clause_suffix in clauses
+            ]) + suffix
 
         return instance
 
@@ -974,59 +867,16 @@ class WordConstructor(object):
         ref_col_skip = column_skip.word.words
 
         for language in instance.languages:
-            offset_prefix = GRAMMARS[language]['cells']['offset']['prefix']
-            offset_suffix = GRAMMARS[language]['cells']['offset']['suffix']
-
-            ref_row_prefix = GRAMMARS[language]['cells']['offset'][
-                'reference-cell-row']['prefix']
-            ref_row_suffix = GRAMMARS[language]['cells']['offset'][
-                'reference-cell-row']['suffix']
-            ref_row_word = (ref_row_prefix +
-                            index_row[language][reference.row] +
-                            ref_row_suffix)
-
-            ref_col_prefix = GRAMMARS[language]['cells']['offset'][
-                'reference-cell-column']['prefix']
-            ref_col_suffix = GRAMMARS[language]['cells']['offset'][
-                'reference-cell-column']['suffix']
-            ref_col_word = (ref_col_prefix +
-                            index_col[language][reference.column] +
-                            ref_col_suffix)
-            # HERE USING REFERENCE
-            skip_row_prefix = GRAMMARS[language]['cells']['offset'][
-                'skip-of-rows']['prefix']
-            skip_row_suffix = GRAMMARS[language]['cells']['offset'][
-                'skip-of-rows']['suffix']
-            skip_row_word = (skip_row_prefix +
-                             ref_row_skip[language] +
-                             skip_row_suffix)
-
-            skip_col_prefix = GRAMMARS[language]['cells']['offset'][
-                'skip-of-columns']['prefix']
-            skip_col_suffix = GRAMMARS[language]['cells']['offset'][
-                'skip-of-columns']['suffix']
-            skip_col_word = (skip_col_prefix +
-                             ref_col_skip[language] +
-                             skip_col_suffix)
-
-            # Swap the words to desired sequence
-            clausules_order = GRAMMARS[language]['cells']['offset']['order']
-            prefered_order = ('reference-cell-row', 'reference-cell-column',
-                              'skip-of-rows', 'skip-of-columns')
-            words_in_prefered_order = (ref_row_word, ref_col_word,
-                                       skip_row_word, skip_col_word)
-            words_in_correct_order = ["", "", "", ""]
-            # Do the permutation and construct the word:
-            for clausule_idx, clausule in enumerate(prefered_order):
-                clausule_permutated_idx = clausules_order.index(clausule)
-                words_in_correct_order[clausule_permutated_idx] = \
-                    words_in_prefered_order[clausule_idx]
-
-            # Merge words into one word
-            final_word = "".join(words_in_correct_order)
-
-            instance.words[language] = offset_prefix + final_word + \
-                offset_suffix
+            prefix, suffix, clauses = _compiled_grammar(language).offset
+            words = (index_row[language][reference.row],
+                     index_col[language][reference.column],
+                     ref_row_skip[language],
+                     ref_col_skip[language])
+            # Merge words of the clauses (in the order of the grammar)
+            instance.words[language] = prefix + "".join([
+                clause_prefix + words[word_idx] + clause_suffix
+                for word_idx, clause_prefix, clause_suffix in clauses
+            ]) + suffix
 
         return instance
 
@@ -1058,7 +908,7 @@ class WordConstructor(object):
         y_e_words = y_end.word.words
         x_words = x.word.words
         for language in instance.languages:
-            pattern: str = GRAMMARS[language]['linear-interpolation']['word']
+            pattern: str = _compiled_grammar(language).linear_interpolation
             word = pattern.format(
                 x_s=x_s_words[language],
                 y_s=y_s_words[language],
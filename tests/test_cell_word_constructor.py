@@ -126,6 +126,23 @@ class TestCellBasicFunctionality(unittest.TestCase):
         t_cell = Cell(3, 4, 7, cell_indices=self.cell_indices)
         self.assertEqual(t_cell.constructing_words, t_cell._constructing_words)
 
+    def test_clone(self):
+        """Test the copying of the cell."""
+        a_cell = Cell(3, 4, 7, cell_indices=self.cell_indices)
+        u_cell = a_cell + a_cell
+        u_cell.excel_format = {'bold': True}
+        t_clone = u_cell._clone()
+        self.assertIs(t_clone.cell_indices, u_cell.cell_indices)
+        self.assertEqual(t_clone.value, 14)
+        self.assertDictEqual(t_clone.parse, u_cell.parse)
+        # Mutable containers are not shared
+        t_clone.coordinates = (1, 1)
+        t_clone.excel_format['bold'] = False
+        t_clone.constructing_words.words['excel'] = ''
+        self.assertTupleEqual(u_cell.coordinates, (None, None))
+        self.assertDictEqual(u_cell.excel_format, {'bold': True})
+        self.assertEqual(u_cell.parse['excel'], '=F5+F5')
+
     def test_conditional(self):
         """Regression test for the conditional."""
         a_cell_cond_1 = Cell(1, 3, 8, cell_indices=self.cell_indices)
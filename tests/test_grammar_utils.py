@@ -1,8 +1,10 @@
 import unittest
 import copy
 
-from portable_spreadsheet.grammar_utils import GrammarUtils
+from portable_spreadsheet.grammar_utils import GrammarUtils, \
+    _compiled_grammar
 from portable_spreadsheet.grammars import GRAMMARS
+from portable_spreadsheet.sheet import Sheet
 
 
 class TestGrammarUtils(unittest.TestCase):
@@ -25,6 +27,12 @@ class TestGrammarUtils(unittest.TestCase):
         correct_grammar = copy.deepcopy(GRAMMARS['native'])
         self.assertTrue(GrammarUtils.validate_grammar(correct_grammar, True))
 
+        # Wrong type of the nested value
+        wrong_new_grammar = copy.deepcopy(GRAMMARS['native'])
+        wrong_new_grammar['cells']['reference']['prefix'] = 7
+        with self.assertRaisesRegex(ValueError, "'reference', 'prefix'"):
+            GrammarUtils.validate_grammar(wrong_new_grammar, True)
+
     def test_add_remove_grammar(self):
         """Tests if adding and removing of grammars works."""
         # Test if exception is raised when incorrect grammar is added
@@ -46,6 +54,51 @@ class TestGrammarUtils(unittest.TestCase):
         set_after_deleting = GrammarUtils.get_languages()
         self.assertSetEqual(set_after_deleting, grammars_before)
 
+    def test_compiled_grammar(self):
+        """Test that the compiled grammar follows the registered grammar."""
+        compiled = _compiled_grammar('excel')
+        self.assertTupleEqual(compiled.operations['add'], ('', '+', ''))
+        self.assertTupleEqual(compiled.operations['sum'], ('SUM(', '', ')'))
+        self.assertIs(_compiled_grammar('excel'), compiled)
+        # Replaced grammar is compiled again
+        language = "compiled-test"
+        new_grammar = copy.deepcopy(GRAMMARS['native'])
+        GrammarUtils.add_grammar(new_grammar, language)
+        self.assertEqual(_compiled_grammar(language).operations['add'][1],
+                         ' + ')
+        GrammarUtils.remove_grammar(language)
+        new_grammar = copy.deepcopy(new_grammar)
+        new_grammar['operations']['add']['separator'] = ' plus '
+        GrammarUtils.add_grammar(new_grammar, language)
+        self.assertEqual(_compiled_grammar(language).operations['add'][1],
+                         ' plus ')
+        GrammarUtils.remove_grammar(language)
+
+    def test_reregistered_grammar(self):
+        """Test that the re-registered language uses the changed grammar.
+        """
+        language = "reregistered-test"
+
+        def construct_sum() -> str:
+            sheet = Sheet.create_new_sheet(
+                1, 3, {language: (['R_0'], ['C_0', 'C_1', 'C_2'])})
+            sheet.iloc[0, 0] = 1
+            sheet.iloc[0, 1] = 2
+            sheet.iloc[0, 2] = sheet.iloc[0, 0] + sheet.iloc[0, 1]
+            return sheet.iloc[0, 2].parse[language]
+
+        new_grammar = copy.deepcopy(GRAMMARS['native'])
+        GrammarUtils.add_grammar(new_grammar, language)
+        self.assertIn(' + ', construct_sum())
+        GrammarUtils.remove_grammar(language)
+        # The same grammar object is changed and registered again
+        new_grammar['operations']['add']['separator'] = ' plus '
+        GrammarUtils.add_grammar(new_grammar, language)
+        try:
+            self.assertIn(' plus ', construct_sum())
+        finally:
+            GrammarUtils.remove_grammar(language)
+
     def test_system_consistency(self):
         """Check the method for probing system consistency."""
         self.assertTrue(GrammarUtils.check_system_consistency())
@@ -11,6 +11,7 @@ from portable_spreadsheet.cell_type import CellType
 from portable_spreadsheet.cell_slice import CellSlice
 from portable_spreadsheet.cell_indices import CellIndices
 from portable_spreadsheet.cell_indices_templates import excel_generator
+from portable_spreadsheet.skipped_label import SkippedLabel
 from portable_spreadsheet import __version__
 
 
@@ -164,6 +165,37 @@ class TestSheetBasicFunctionality(unittest.TestCase):
                              self.rows_help_text + new_rows_help_text)
         self.assertListEqual(cell_indices.columns_help_text,
                              self.columns_help_text + new_columns_help_text)
+        # The original indices are not modified by expanding
+        original: CellIndices = self.sheet.cell_indices
+        self.assertListEqual(original.rows['native'], self.native_rows)
+        self.assertListEqual(original.columns['native'], self.native_cols)
+        self.assertListEqual(original.rows_labels, self.rows_labels)
+        self.assertListEqual(original.rows_help_text, self.rows_help_text)
+        self.assertListEqual(new_cell_idx.languages, original.languages)
+
+    def test_expand_keeps_labels(self):
+        """Test that expanding without new labels keeps the existing ones"""
+        cell_indices = CellIndices(2, 3,
+                                   rows_labels=['a', 'b'],
+                                   columns_labels=['x', 'y', 'z'])
+        expanded = cell_indices.expand_size(2, 1)
+        self.assertListEqual(expanded.rows_labels, ['a', 'b', '2', '3'])
+        self.assertListEqual(expanded.columns_labels, ['x', 'y', 'z', '3'])
+        self.assertListEqual(expanded.rows_labels_str, expanded.rows_labels)
+
+    def test_expand_copies_skipped_labels(self):
+        """Test that the skipped labels are not shared by the cell indices
+            (they are changed in place when exported)"""
+        rows_labels = [SkippedLabel('a b'), 'c']
+        cell_indices = CellIndices(2, 1, rows_labels=rows_labels)
+        expanded = cell_indices.expand_size(1, 0)
+        labels = (rows_labels[0], cell_indices.rows_labels[0],
+                  expanded.rows_labels[0])
+        self.assertEqual(len(set(map(id, labels))), 3)
+        expanded.rows_labels[0].replace(' ', '_')
+        self.assertEqual(str(rows_labels[0]), 'a b')
+        self.assertEqual(str(cell_indices.rows_labels[0]), 'a b')
+        self.assertEqual(str(expanded.rows_labels[0]), 'a_b')
 
     def test_cell_indices(self):
         """Test the indices inside sheet"""
@@ -361,6 +393,161 @@ class TestSheetSelection(unittest.TestCase):
         # Test getter
         self.assertAllClose2D(sheet.iloc[i_idx].to_numpy(), np_sheet[i_idx])
 
+    def test_slice_set_cells(self):
+        """Test setting the slice to the cell (reference, variable and
+            computed cell)."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.var['a'] = 5
+        sheet.iloc[0, 0] = 7
+        # Reference to the anchored cell
+        sheet.iloc[1:3, 0] = sheet.iloc[0, 0]
+        # Variable
+        sheet.iloc[1:3, 1] = sheet.var['a']
+        # Computed (not anchored) cell
+        sheet.iloc[1:3, 2] = sheet.iloc[0, 0] * sheet.var['a']
+        for row in (1, 2):
+            self.assertEqual(sheet.iloc[row, 0].value, 7)
+            self.assertEqual(sheet.iloc[row, 0].parse['excel'], '=B2')
+            self.assertTrue(sheet.iloc[row, 0].anchored)
+            self.assertTupleEqual(sheet.iloc[row, 0].coordinates, (row, 0))
+            self.assertEqual(sheet.iloc[row, 1].value, 5)
+            self.assertEqual(sheet.iloc[row, 1].parse['excel'], '=a')
+            self.assertEqual(sheet.iloc[row, 2].value, 35)
+            self.assertEqual(sheet.iloc[row, 2].parse['excel'], '=B2*a')
+            self.assertTupleEqual(sheet.iloc[row, 2].coordinates, (row, 2))
+        # The references can be aggregated as any other anchored cells
+        total = sheet.iloc[1:3, 0].sum()
+        self.assertEqual(total.value, 14)
+        self.assertEqual(total.parse['excel'], '=SUM(B3:B4)')
+
+    def test_set_cell_reference(self):
+        """Test setting the single cell to the anchored cell (the reference
+            stays in place of the referenced cell in formulas)."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.iloc[0, 0] = 7
+        sheet.iloc[1, 0] = sheet.iloc[0, 0]
+        self.assertFalse(sheet.iloc[1, 0].anchored)
+        self.assertEqual(sheet.iloc[1, 0].parse['excel'], '=B2')
+        sheet.iloc[2, 0] = sheet.iloc[1, 0] + sheet.fn.const(1)
+        self.assertEqual(sheet.iloc[2, 0].value, 8)
+        self.assertEqual(sheet.iloc[2, 0].parse['excel'], '=B2+1')
+
+    def test_slice_set_single_cell(self):
+        """Test setting the 1x1 slice to the anchored cell."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.iloc[0, 0] = 7
+        sheet.iloc[2:3, 1:2] = sheet.iloc[0, 0]
+        self.assertTrue(sheet.iloc[2, 1].anchored)
+        self.assertTupleEqual(sheet.iloc[2, 1].coordinates, (2, 1))
+        self.assertEqual(sheet.iloc[2, 1].parse['excel'], '=B2')
+        # Formulas referencing the assigned cell point to its position
+        sheet.iloc[3, 1] = sheet.iloc[2, 1] + sheet.iloc[0, 0]
+        self.assertEqual(sheet.iloc[3, 1].value, 14)
+        self.assertEqual(sheet.iloc[3, 1].parse['excel'], '=C4+B2')
+        total = sheet.iloc[2:4, 1].sum()
+        self.assertEqual(total.value, 21)
+        self.assertEqual(total.parse['excel'], '=SUM(C4:C5)')
+
+    def test_slice_set_cell_list(self):
+        """Test setting the slice to the list of anchored cells."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.iloc[0, 0] = 7
+        sheet.iloc[0, 1] = 3
+        sheet.iloc[1:4, 2] = [sheet.iloc[0, 0], 5, sheet.iloc[0, 1]]
+        for row, col in ((1, 2), (3, 2)):
+            self.assertTrue(sheet.iloc[row, col].anchored)
+            self.assertTupleEqual(sheet.iloc[row, col].coordinates,
+                                  (row, col))
+        self.assertEqual(sheet.iloc[1, 2].parse['excel'], '=B2')
+        self.assertEqual(sheet.iloc[3, 2].parse['excel'], '=C2')
+        total = sheet.iloc[1:4, 2].sum()
+        self.assertEqual(total.value, 15)
+        self.assertEqual(total.parse['excel'], '=SUM(D3:D5)')
+
+    def test_slice_set_2d_list(self):
+        """Test setting the slice to the 2D list."""
+        values = [[1, 2, 3], [4, 5, 6]]
+        self.sheet.iloc[2:4, 3:6] = values
+        self.assertTrue(np.allclose(self.sheet.to_numpy()[2:4, 3:6], values))
+        # Rows of different lengths
+        with self.assertRaises(ValueError):
+            self.sheet.iloc[2:4, 3:6] = [[1, 2, 3], [4, 5]]
+        with self.assertRaises(ValueError):
+            self.sheet.iloc[2:4, 3:6] = [[1, 2, 3, 4], [4, 5, 6, 7]]
+
+    def test_slice_set_values(self):
+        """Test setting the slice to the arrays and lists of values."""
+        values = np.arange(6, dtype=float).reshape(2, 3)
+        self.sheet.iloc[2:4, 3:6] = values
+        self.sheet.iloc[1:5, 1] = np.array([7, 8, 9, 10])
+        self.sheet.iloc[0, 0:3] = 11
+        self.sheet.iloc[0, 3:5] = [12, "text"]
+        self.sheet.iloc[1:3, 6] = (13, 14)
+        result = self.sheet.to_numpy()
+        self.assertTrue(np.allclose(result[2:4, 3:6], values))
+        self.assertTrue(np.allclose(result[1:5, 1], [7, 8, 9, 10]))
+        self.assertTrue(np.allclose(result[0, 0:3], 11))
+        self.assertEqual(result[0, 3], 12)
+        self.assertEqual(self.sheet.iloc[0, 4].value, "text")
+        self.assertTrue(np.allclose(result[1:3, 6], [13, 14]))
+        for row in range(self.n_row):
+            self.assertEqual(len(self.sheet._sheet[row]), self.n_col)
+            for col in range(self.n_col):
+                self.assertEqual(self.sheet.iloc[row, col].coordinates,
+                                 (row, col))
+
+    def test_slice_excel_format(self):
+        """Test setting the Excel format of the slice."""
+        cell_slice = self.sheet.iloc[1:3, 2:5]
+        cell_slice.set(7)
+        cell_slice.excel_format = {'bold': True}
+        for row in range(self.n_row):
+            for col in range(self.n_col):
+                expected = {'bold': True} \
+                    if 1 <= row < 3 and 2 <= col < 5 else {}
+                self.assertDictEqual(self.sheet.iloc[row, col].excel_format,
+                                     expected)
+
+    def test_slice_description(self):
+        """Test setting the description of the slice."""
+        cell_slice = self.sheet.iloc[1:3, 2:5]
+        with self.assertRaises(ValueError):
+            cell_slice.description = 7
+        cell_slice.description = "Slice"
+        for row in range(self.n_row):
+            for col in range(self.n_col):
+                expected = "Slice" if 1 <= row < 3 and 2 <= col < 5 else None
+                self.assertEqual(self.sheet.iloc[row, col].description,
+                                 expected)
+
+    def test_slice_corner_cells(self):
+        """Test that the corner cells come from the same snapshot as the
+            cells of the slice."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.iloc[1:3, 2:5] = 7
+        cell_slice = sheet.iloc[1:3, 2:5]
+        # Changing the sheet does not affect the existing slice
+        sheet.iloc[1:3, 2:5] = 8
+        self.assertIs(cell_slice.start_cell, cell_slice.cell_subset[0])
+        self.assertIs(cell_slice.end_cell, cell_slice.cell_subset[-1])
+        self.assertEqual(cell_slice.start_cell.value, 7)
+        self.assertEqual(cell_slice.end_cell.value, 7)
+        self.assertEqual(cell_slice.sum().value, 42)
+
+    def test_slice_count(self):
+        """Test counting the cells of the slice."""
+        sheet = copy.deepcopy(self.sheet)
+        sheet.iloc[1:3, 2:5] = 7
+        cell_slice = sheet.iloc[0:3, 2:5]
+        count = cell_slice.count()
+        self.assertEqual(count.value, 6)
+        self.assertEqual(count.parse['excel'], '=COUNT(D2:F4)')
+        self.assertEqual(cell_slice.count(skip_none_cell=False).value, 9)
+        self.assertEqual(
+            Cell.count(cell_slice.start_cell, cell_slice.end_cell,
+                       iter(cell_slice.cell_subset)).value, 9
+        )
+
     def test_right_most_included_slices(self):
         """Test the method selectors (get_slice and set_slice)."""
         # A) Test the setter